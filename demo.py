@@ -2,11 +2,23 @@
 """
 Demo script to showcase the habit tracker features
 Run this to see all the commands in action
+
+Commands run in-process by default; pass --isolated to launch a separate
+python process for each command instead.
 """
+import shlex
 import subprocess
+import sys
 import time
+import traceback
 import os
-from pathlib import Path
+
+from typer.testing import CliRunner
+
+from habit_tracker import app, DATA_DIR, DATA_FILES, LEGACY_DATA_FILE
+
+ISOLATED = "--isolated" in sys.argv[1:]
+runner = CliRunner()
 
 def run_cmd(cmd, description):
     """Run a command and display its output"""
@@ -14,18 +26,27 @@ def run_cmd(cmd, description):
     print(f">>> {description}")
     print(f"$ python habit_tracker.py {cmd}")
     print(f"{'-'*70}")
-    result = subprocess.run(f"python habit_tracker.py {cmd}", shell=True, capture_output=False)
-    time.sleep(1)
-    return result.returncode == 0
+    if ISOLATED:
+        result = subprocess.run(f"python habit_tracker.py {cmd}", shell=True, capture_output=False)
+        time.sleep(1)
+        return result.returncode == 0
+
+    result = runner.invoke(app, shlex.split(cmd))
+    print(result.stdout, end="")
+    if result.exit_code != 0 and result.exc_info and not isinstance(result.exception, SystemExit):
+        # The runner catches exceptions, so show the traceback a subprocess would have
+        print("".join(traceback.format_exception(*result.exc_info)), end="")
+    return result.exit_code == 0
 
 def main():
     # Clean up any existing data
-    data_file = Path.home() / ".habit_tracker_data.json"
-    if data_file.exists():
-        response = input(f"\nExisting data found at {data_file}. Delete it for demo? (y/n): ")
+    data_files = [path for path in [*DATA_FILES.values(), LEGACY_DATA_FILE] if path.exists()]
+    if data_files:
+        response = input(f"\nExisting data found in {DATA_DIR}. Delete it for demo? (y/n): ")
         if response.lower() == 'y':
-            data_file.unlink()
-            print("Data file deleted.\n")
+            for path in data_files:
+                path.unlink()
+            print("Data files deleted.\n")
 
     print("\n" + "="*70)
     print("CLI HABIT TRACKER DEMO")
@@ -64,7 +85,7 @@ def main():
     print("\n" + "="*70)
     print("DEMO COMPLETE!")
     print("="*70)
-    print("\nYour data is saved in:", data_file)
+    print("\nYour data is saved in:", DATA_DIR)
     print("Try exploring more commands and building your habits!")
     print("\nRun 'python habit_tracker.py --help' to see all available commands")
 
@@ -2,54 +2,247 @@
 """
 CLI Habit Tracker - Track your daily habits and build streaks
 """
+import atexit
+import bisect
 import json
+import mmap
+import os
 import typer
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
-import schedule
-import time
-import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DATA_DIR = Path.home() / ".habit_tracker"
+# Habits and reminders live in separate files so each command only
+# parses, and each change only rewrites, the part it touches
+SECTIONS = ("habits", "reminders")
+DATA_FILES = {
+    "habits": DATA_DIR / "habits.json",
+    "reminders": DATA_DIR / "reminders.json",
+}
+# Single-file format used before habits and reminders were split
+LEGACY_DATA_FILE = Path.home() / ".habit_tracker_data.json"
+# Set HABIT_TRACKER_PRETTY=1 to keep the data file human-readable
+PRETTY_JSON = bool(os.environ.get("HABIT_TRACKER_PRETTY"))
+# Version 2 stores completions as day ordinals instead of ISO strings
+DATA_VERSION = 2
+
+
+def _loads(raw) -> dict:
+    """Parse JSON from a bytes-like object, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _today() -> str:
+    """Today's date as an ISO string"""
+    return datetime.now().date().isoformat()
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """Write a file via a temp file so an interrupted save never truncates it"""
+    path.parent.mkdir(exist_ok=True)
+    tmp_file = path.with_suffix(".json.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, path)
+
+
+def _migrate_legacy_data():
+    """Split the old single data file into per-section files on first run"""
+    if not LEGACY_DATA_FILE.exists() or any(path.exists() for path in DATA_FILES.values()):
+        return
 
-app = typer.Typer(help="Track your daily habits and build streaks")
-console = Console(force_terminal=True, legacy_windows=False)
+    legacy = _loads(LEGACY_DATA_FILE.read_bytes())
+    _write_atomic(DATA_FILES["habits"], _dumps({
+        "version": legacy.get("version", 1),
+        "habits": legacy["habits"]
+    }))
+    _write_atomic(DATA_FILES["reminders"], _dumps({"reminders": legacy.get("reminders", {})}))
 
-DATA_FILE = Path.home() / ".habit_tracker_data.json"
 
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date string, caching results across calls"""
+    return date.fromisoformat(value)
+
+
+def _has_completion(completions: List[int], day: int) -> bool:
+    """Binary-search a sorted list of completion ordinals for a day"""
+    idx = bisect.bisect_left(completions, day)
+    return idx < len(completions) and completions[idx] == day
 
-class HabitTracker:
-    def __init__(self):
-        self.data = self.load_data()
 
-    def load_data(self) -> dict:
-        """Load habit data from JSON file"""
-        if DATA_FILE.exists():
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
-        return {"habits": {}, "reminders": {}}
+def _iso_from_ordinal(day: Optional[int]) -> Optional[str]:
+    """Convert a day ordinal back to an ISO date string"""
+    return date.fromordinal(day).isoformat() if day is not None else None
 
-    def save_data(self):
-        """Save habit data to JSON file"""
-        with open(DATA_FILE, 'w') as f:
-            json.dump(self.data, f, indent=2)
+
+@dataclass
+class Habit:
+    """A tracked habit and its cached streak state
+
+    Completion dates are held as a sorted list of day ordinals
+    (``date.toordinal()``); they are only turned back into ISO strings
+    for display.
+    """
+    __slots__ = ("description", "created_date", "completions",
+                 "current_streak", "longest_streak", "last_completed")
+
+    description: str
+    created_date: str
+    completions: List[int]
+    current_streak: int
+    longest_streak: int
+    last_completed: Optional[int]
+
+    @classmethod
+    def from_dict(cls, data: dict, version: int = DATA_VERSION) -> "Habit":
+        """Build a habit from its JSON representation"""
+        if version >= 2:
+            completions = sorted(data["completions_ord"])
+        else:
+            # Version 1 files stored completions as ISO date strings
+            completions = sorted(_parse_date(d).toordinal() for d in data["completions"])
+        last_completed = data.get("last_completed")
+        return cls(
+            description=data["description"],
+            created_date=data["created_date"],
+            completions=completions,
+            current_streak=data["current_streak"],
+            longest_streak=data["longest_streak"],
+            last_completed=(
+                _parse_date(last_completed).toordinal() if last_completed
+                else completions[-1] if completions else None
+            )
+        )
+
+    def to_dict(self) -> dict:
+        """Convert the habit to its JSON representation"""
+        return {
+            "description": self.description,
+            "created_date": self.created_date,
+            "completions_ord": self.completions,
+            "current_streak": self.current_streak,
+            "longest_streak": self.longest_streak,
+            "last_completed": _iso_from_ordinal(self.last_completed)
+        }
+
+
+class HabitTracker:
+    def __init__(self, load: Tuple[str, ...] = SECTIONS, readonly: bool = False):
+        self._readonly = readonly
+        self._saved_hashes: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+        self.data: dict = {}
+        _migrate_legacy_data()
+        for section in load:
+            self.load_section(section)
+        if not readonly:
+            # Commands flush when they finish; this only catches other callers
+            atexit.register(self.flush)
+
+    def load_section(self, section: str):
+        """Load one section of the data ("habits" or "reminders") from its file"""
+        data = self.load_readonly(section) if self._readonly else self.load_data(section)
+        if data is None:
+            self.data[section] = {}
+        elif section == "habits":
+            self.data[section] = self._prepare_habits(data)
+        else:
+            self.data[section] = data[section]
+
+    def load_data(self, section: str) -> Optional[dict]:
+        """Load a section's JSON file"""
+        path = DATA_FILES[section]
+        if path.exists():
+            raw = path.read_bytes()
+            self._saved_hashes[section] = hash(raw)
+            return _loads(raw)
+        return None
+
+    def load_readonly(self, section: str) -> Optional[dict]:
+        """Load a section's JSON file through a read-only memory map"""
+        path = DATA_FILES[section]
+        if path.exists() and path.stat().st_size:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return _loads(view)
+        return None
+
+    def _prepare_habits(self, data: dict) -> dict:
+        """Convert freshly loaded habits for in-memory use"""
+        version = data.get("version", 1)
+        habits = {name: Habit.from_dict(habit, version) for name, habit in data["habits"].items()}
+
+        # A streak stored on an earlier day is broken once a full day is missed.
+        # last_completed may be a future-dated mark, so look up the latest
+        # completion up to today instead
+        today_ord = _parse_date(_today()).toordinal()
+        for habit in habits.values():
+            idx = bisect.bisect_right(habit.completions, today_ord) - 1
+            if idx < 0 or habit.completions[idx] < today_ord - 1:
+                habit.current_streak = 0
+        return habits
+
+    def save_data(self, *sections: str):
+        """Mark sections of the data as changed; they are written on flush()"""
+        if self._readonly:
+            raise RuntimeError("Habit data was loaded read-only and cannot be saved")
+        self._dirty.update(sections)
+
+    def flush(self):
+        """Write pending changes to disk, if any"""
+        while self._dirty:
+            self._save_now(self._dirty.pop())
+
+    def _save_now(self, section: str):
+        """Save a section to its JSON file, skipping the write if nothing changed"""
+        if section == "habits":
+            payload = _dumps({
+                "version": DATA_VERSION,
+                "habits": {name: habit.to_dict() for name, habit in self.data["habits"].items()}
+            })
+        else:
+            payload = _dumps({section: self.data[section]})
+        payload_hash = hash(payload)
+        if payload_hash == self._saved_hashes.get(section):
+            return
+
+        _write_atomic(DATA_FILES[section], payload)
+        self._saved_hashes[section] = payload_hash
 
     def add_habit(self, name: str, description: str = ""):
         """Add a new habit"""
         if name in self.data["habits"]:
             return False, "Habit already exists"
 
-        self.data["habits"][name] = {
-            "description": description,
-            "created_date": datetime.now().isoformat(),
-            "completions": [],
-            "current_streak": 0,
-            "longest_streak": 0
-        }
-        self.save_data()
+        self.data["habits"][name] = Habit(
+            description=description,
+            created_date=datetime.now().isoformat(),
+            completions=[],
+            current_streak=0,
+            longest_streak=0,
+            last_completed=None
+        )
+        self.save_data("habits")
         return True, f"Habit '{name}' added successfully"
 
     def remove_habit(self, name: str):
@@ -58,105 +251,146 @@ class HabitTracker:
             return False, "Habit not found"
 
         del self.data["habits"][name]
+        self.save_data("habits")
         if name in self.data["reminders"]:
             del self.data["reminders"][name]
-        self.save_data()
+            self.save_data("reminders")
         return True, f"Habit '{name}' removed successfully"
 
-    def mark_done(self, name: str, date: Optional[str] = None):
+    def mark_done(self, name: str, date: Optional[str] = None, today: Optional[str] = None):
         """Mark a habit as done for a specific date"""
         if name not in self.data["habits"]:
             return False, "Habit not found"
 
+        today = today or _today()
         if date is None:
-            date = datetime.now().date().isoformat()
+            date = today
+
+        try:
+            day = _parse_date(date).toordinal()
+        except ValueError:
+            return False, "Invalid date format. Use YYYY-MM-DD (e.g., 2024-01-31)"
+        today_ord = _parse_date(today).toordinal()
 
         habit = self.data["habits"][name]
+        completions = habit.completions
 
-        if date in habit["completions"]:
+        idx = bisect.bisect_left(completions, day)
+        if idx < len(completions) and completions[idx] == day:
             return False, "Habit already marked as done for this date"
 
-        habit["completions"].append(date)
-        habit["completions"].sort()
-        self._update_streaks(name)
-        self.save_data()
+        completions.insert(idx, day)
+
+        # Fast path for the common "done today" case: extend the cached
+        # streak instead of recomputing it from the whole history
+        last_completed = habit.last_completed
+        if day == today_ord and (last_completed is None or last_completed < day):
+            if not _has_completion(completions, day - 1):
+                habit.current_streak = 1
+            elif self._cached_streak_ends_at(completions, idx - 1, habit.current_streak):
+                habit.current_streak += 1
+            else:
+                self._update_streaks(name, today)
+            habit.longest_streak = max(habit.longest_streak, habit.current_streak)
+            habit.last_completed = day
+        else:
+            self._update_streaks(name, today)
+        self.save_data("habits")
         return True, f"Habit '{name}' marked as done for {date}"
 
-    def unmark_done(self, name: str, date: Optional[str] = None):
+    @staticmethod
+    def _cached_streak_ends_at(completions: List[int], end: int, streak: int) -> bool:
+        """Check that a cached streak is exactly the run ending at completions[end]
+
+        The stored streak is only trustworthy if it was computed on the day of
+        that completion; checking the run's two boundaries in the sorted list
+        verifies it without walking the history.
+        """
+        start = end - streak + 1
+        if streak <= 0 or start < 0 or completions[start] != completions[end] - streak + 1:
+            return False
+        return start == 0 or completions[start - 1] != completions[start] - 1
+
+    def unmark_done(self, name: str, date: Optional[str] = None, today: Optional[str] = None):
         """Unmark a habit for a specific date"""
         if name not in self.data["habits"]:
             return False, "Habit not found"
 
+        today = today or _today()
         if date is None:
-            date = datetime.now().date().isoformat()
+            date = today
+
+        try:
+            day = _parse_date(date).toordinal()
+        except ValueError:
+            return False, "Invalid date format. Use YYYY-MM-DD (e.g., 2024-01-31)"
 
         habit = self.data["habits"][name]
+        completions = habit.completions
 
-        if date not in habit["completions"]:
+        idx = bisect.bisect_left(completions, day)
+        if idx == len(completions) or completions[idx] != day:
             return False, "Habit was not marked as done for this date"
 
-        habit["completions"].remove(date)
-        self._update_streaks(name)
-        self.save_data()
+        del completions[idx]
+        self._update_streaks(name, today)
+        self.save_data("habits")
         return True, f"Habit '{name}' unmarked for {date}"
 
-    def _update_streaks(self, name: str):
+    def _update_streaks(self, name: str, today: Optional[str] = None):
         """Calculate and update current and longest streaks"""
         habit = self.data["habits"][name]
-        completions = [datetime.fromisoformat(d).date() for d in habit["completions"]]
+        ordinals = habit.completions
 
-        if not completions:
-            habit["current_streak"] = 0
-            habit["longest_streak"] = 0
+        if not ordinals:
+            habit.current_streak = 0
+            habit.longest_streak = 0
+            habit.last_completed = None
             return
 
-        completions.sort(reverse=True)
-        today = datetime.now().date()
+        today_ord = _parse_date(today or _today()).toordinal()
+
+        # Split the history into runs of consecutive days
+        run_starts = [0] + [i for i in range(1, len(ordinals)) if ordinals[i] - ordinals[i - 1] != 1]
+        run_ends = run_starts[1:] + [len(ordinals)]
 
-        # Calculate current streak
+        # Current streak is the run ending today, or yesterday if today isn't done yet
         current_streak = 0
-        expected_date = today
-
-        for completion_date in completions:
-            if completion_date == expected_date:
-                current_streak += 1
-                expected_date -= timedelta(days=1)
-            elif completion_date == expected_date + timedelta(days=1):
-                # Allow for yesterday if today isn't done yet
-                current_streak += 1
-                expected_date -= timedelta(days=1)
-            else:
-                break
-
-        # Calculate longest streak
-        longest_streak = 0
-        temp_streak = 1
-
-        completions.sort()
-        for i in range(1, len(completions)):
-            diff = (completions[i] - completions[i-1]).days
-            if diff == 1:
-                temp_streak += 1
-                longest_streak = max(longest_streak, temp_streak)
-            else:
-                temp_streak = 1
+        last = bisect.bisect_right(ordinals, today_ord) - 1
+        if last >= 0 and ordinals[last] >= today_ord - 1:
+            run_start = run_starts[bisect.bisect_right(run_starts, last) - 1]
+            current_streak = last - run_start + 1
 
-        longest_streak = max(longest_streak, temp_streak)
+        longest_streak = max(end - start for start, end in zip(run_starts, run_ends))
 
-        habit["current_streak"] = current_streak
-        habit["longest_streak"] = longest_streak
+        habit.current_streak = current_streak
+        habit.longest_streak = longest_streak
+        habit.last_completed = ordinals[-1]
 
     def get_habits(self) -> dict:
         """Get all habits"""
         return self.data["habits"]
 
-    def get_habit_stats(self, name: str) -> Optional[dict]:
+    def get_done_today(self, today: Optional[str] = None) -> dict:
+        """Map each habit name to whether it is done for today"""
+        today_ord = _parse_date(today or _today()).toordinal()
+        # last_completed answers this without touching completions, unless a
+        # future date has been marked and today has to be looked up
+        return {
+            name: habit.last_completed == today_ord or (
+                habit.last_completed is not None and habit.last_completed > today_ord
+                and _has_completion(habit.completions, today_ord)
+            )
+            for name, habit in self.data["habits"].items()
+        }
+
+    def get_habit_stats(self, name: str, today: Optional[str] = None) -> Optional[dict]:
         """Get statistics for a specific habit"""
         if name not in self.data["habits"]:
             return None
 
         habit = self.data["habits"][name]
-        completions = habit["completions"]
+        completions = habit.completions
 
         if not completions:
             return {
@@ -169,22 +403,24 @@ class HabitTracker:
                 "last_completed": None
             }
 
-        today = datetime.now().date()
-        last_7_days = [(today - timedelta(days=i)).isoformat() for i in range(7)]
-        last_30_days = [(today - timedelta(days=i)).isoformat() for i in range(30)]
+        # Completions are sorted, so each window is a bisected slice
+        today_ord = _parse_date(today or _today()).toordinal()
+        window_end = bisect.bisect_right(completions, today_ord)
+        start_7d = bisect.bisect_left(completions, today_ord - 6)
+        start_30d = bisect.bisect_left(completions, today_ord - 29)
 
-        completed_7d = sum(1 for d in last_7_days if d in completions)
-        completed_30d = sum(1 for d in last_30_days if d in completions)
+        completed_7d = window_end - start_7d
+        completed_30d = window_end - start_30d
 
         return {
             "name": name,
-            "description": habit["description"],
+            "description": habit.description,
             "total_completions": len(completions),
-            "current_streak": habit["current_streak"],
-            "longest_streak": habit["longest_streak"],
+            "current_streak": habit.current_streak,
+            "longest_streak": habit.longest_streak,
             "success_rate_7d": round((completed_7d / 7) * 100, 1),
             "success_rate_30d": round((completed_30d / 30) * 100, 1),
-            "last_completed": completions[-1] if completions else None
+            "last_completed": _iso_from_ordinal(habit.last_completed)
         }
 
     def set_reminder(self, name: str, time_str: str):
@@ -198,7 +434,7 @@ class HabitTracker:
             return False, "Invalid time format. Use HH:MM (e.g., 09:00)"
 
         self.data["reminders"][name] = time_str
-        self.save_data()
+        self.save_data("reminders")
         return True, f"Reminder set for '{name}' at {time_str}"
 
     def get_reminders(self) -> dict:
@@ -206,7 +442,42 @@ class HabitTracker:
         return self.data["reminders"]
 
 
-tracker = HabitTracker()
+@lru_cache(maxsize=1)
+def get_console():
+    """Create the rich console on first use to keep rich out of startup"""
+    from rich.console import Console
+
+    return Console(force_terminal=True, legacy_windows=False)
+
+
+_tracker: Optional[HabitTracker] = None
+
+
+def _flush_tracker(*args, **kwargs):
+    """Save pending changes once a command has finished, so errors reach the user"""
+    if _tracker is not None:
+        _tracker.flush()
+
+
+app = typer.Typer(help="Track your daily habits and build streaks", result_callback=_flush_tracker)
+
+
+def get_tracker(load: Tuple[str, ...] = SECTIONS, readonly: bool = False) -> HabitTracker:
+    """Load the tracker on first use, so e.g. --help never reads the data files
+
+    Commands name the data sections they use in ``load`` so that other
+    files are never parsed. Commands that never modify habits pass
+    readonly=True to get a tracker that memory-maps the data files and
+    refuses to save.
+    """
+    global _tracker
+    if _tracker is None or (_tracker._readonly and not readonly):
+        _tracker = HabitTracker(load=load, readonly=readonly)
+    else:
+        for section in load:
+            if section not in _tracker.data:
+                _tracker.load_section(section)
+    return _tracker
 
 
 @app.command()
@@ -215,6 +486,8 @@ def add(
     description: str = typer.Option("", "--description", "-d", help="Description of the habit")
 ):
     """Add a new habit to track"""
+    console = get_console()
+    tracker = get_tracker(load=("habits",))
     success, message = tracker.add_habit(name, description)
     if success:
         console.print(f"[green]+[/green] {message}")
@@ -225,6 +498,8 @@ def add(
 @app.command()
 def remove(name: str):
     """Remove a habit"""
+    console = get_console()
+    tracker = get_tracker()
     success, message = tracker.remove_habit(name)
     if success:
         console.print(f"[green]+[/green] {message}")
@@ -238,13 +513,15 @@ def done(
     date: Optional[str] = typer.Option(None, "--date", "-d", help="Date (YYYY-MM-DD), defaults to today")
 ):
     """Mark a habit as done"""
-    success, message = tracker.mark_done(name, date)
+    console = get_console()
+    tracker = get_tracker(load=("habits",))
+    success, message = tracker.mark_done(name, date, today=_today())
     if success:
         console.print(f"[green]+[/green] {message}")
 
         # Show updated streak
         habit = tracker.data["habits"][name]
-        streak = habit["current_streak"]
+        streak = habit.current_streak
         if streak > 0:
             console.print(f"[yellow]>> Current streak: {streak} days![/yellow]")
     else:
@@ -257,7 +534,9 @@ def undone(
     date: Optional[str] = typer.Option(None, "--date", "-d", help="Date (YYYY-MM-DD), defaults to today")
 ):
     """Unmark a habit"""
-    success, message = tracker.unmark_done(name, date)
+    console = get_console()
+    tracker = get_tracker(load=("habits",))
+    success, message = tracker.unmark_done(name, date, today=_today())
     if success:
         console.print(f"[green]+[/green] {message}")
     else:
@@ -267,13 +546,19 @@ def undone(
 @app.command()
 def list():
     """List all habits with today's status"""
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    console = get_console()
+    tracker = get_tracker(readonly=True)
     habits = tracker.get_habits()
 
     if not habits:
         console.print("[yellow]No habits tracked yet. Add one with 'habit-tracker add <name>'[/yellow]")
         return
 
-    today = datetime.now().date().isoformat()
+    done_today = tracker.get_done_today(_today())
 
     table = Table(title="Your Habits", box=box.ROUNDED)
     table.add_column("Habit", style="cyan", no_wrap=True)
@@ -282,16 +567,18 @@ def list():
     table.add_column("Best", justify="center", style="green")
     table.add_column("Description", style="dim")
 
-    for name, habit in habits.items():
-        done_today = "+" if today in habit["completions"] else "o"
-        status_style = "green" if today in habit["completions"] else "dim"
+    # Generated cells are Text objects so Rich skips markup parsing for them;
+    # names and descriptions stay plain strings so their markup still renders
+    done_status = Text("+", style="green")
+    pending_status = Text("o", style="dim")
 
+    for name, habit in habits.items():
         table.add_row(
             name,
-            f"[{status_style}]{done_today}[/{status_style}]",
-            f"{habit['current_streak']}d",
-            f"Best: {habit['longest_streak']}d",
-            habit["description"]
+            done_status if done_today[name] else pending_status,
+            Text(f"{habit.current_streak}d"),
+            Text(f"Best: {habit.longest_streak}d"),
+            habit.description
         )
 
     console.print(table)
@@ -307,7 +594,11 @@ def list():
 @app.command()
 def stats(name: str):
     """Show detailed statistics for a habit"""
-    stats = tracker.get_habit_stats(name)
+    from rich.panel import Panel
+
+    console = get_console()
+    tracker = get_tracker(load=("habits",), readonly=True)
+    stats = tracker.get_habit_stats(name, today=_today())
 
     if stats is None:
         console.print(f"[red]x[/red] Habit '{name}' not found")
@@ -336,21 +627,30 @@ def history(
     days: int = typer.Option(30, "--days", "-n", help="Number of days to show")
 ):
     """Show completion history for a habit"""
+    console = get_console()
+    tracker = get_tracker(load=("habits",), readonly=True)
     if name not in tracker.data["habits"]:
         console.print(f"[red]x[/red] Habit '{name}' not found")
         return
 
     habit = tracker.data["habits"][name]
-    completions = set(habit["completions"])
+    completions = habit.completions
 
     console.print(f"\n[bold]History for '{name}' (last {days} days)[/bold]\n")
 
-    today = datetime.now().date()
+    today = _parse_date(_today())
+
+    # Walk the completions in the window newest-first alongside the days
+    today_ord = today.toordinal()
+    window_start = bisect.bisect_left(completions, today_ord - (days - 1))
+    idx = bisect.bisect_right(completions, today_ord) - 1
+
     for i in range(days):
         date = today - timedelta(days=i)
         date_str = date.isoformat()
 
-        if date_str in completions:
+        if idx >= window_start and completions[idx] == today_ord - i:
+            idx -= 1
             symbol = "+"
             style = "green"
         else:
@@ -367,6 +667,8 @@ def remind(
     time: str
 ):
     """Set a reminder for a habit (time in HH:MM format, e.g., 09:00)"""
+    console = get_console()
+    tracker = get_tracker()
     success, message = tracker.set_reminder(name, time)
     if success:
         console.print(f"[green]+[/green] {message}")
@@ -378,14 +680,20 @@ def remind(
 @app.command()
 def today():
     """Show quick summary for today"""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+    tracker = get_tracker(load=("habits",), readonly=True)
     habits = tracker.get_habits()
 
     if not habits:
         console.print("[yellow]No habits tracked yet.[/yellow]")
         return
 
-    today = datetime.now().date().isoformat()
-    completed = sum(1 for h in habits.values() if today in h["completions"])
+    today = _today()
+    done_today = tracker.get_done_today(today)
+    completed = sum(done_today.values())
     total = len(habits)
 
     percentage = (completed / total * 100) if total > 0 else 0
@@ -408,13 +716,13 @@ def today():
         message = "You can do it!"
 
     console.print(Panel(
-        f"[{color}]{symbol} {completed}/{total} habits completed ({percentage:.0f}%)\n{message}[/{color}]",
-        title=f"Today - {datetime.now().strftime('%B %d, %Y')}",
+        Text(f"{symbol} {completed}/{total} habits completed ({percentage:.0f}%)\n{message}", style=color),
+        title=f"Today - {_parse_date(today).strftime('%B %d, %Y')}",
         border_style=color
     ))
 
     # Show incomplete habits
-    incomplete = [name for name, habit in habits.items() if today not in habit["completions"]]
+    incomplete = [name for name, done in done_today.items() if not done]
     if incomplete:
         console.print("\n[bold]Still to do:[/bold]")
         for habit_name in incomplete:
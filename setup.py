@@ -7,8 +7,10 @@ setup(
     install_requires=[
         "typer[all]==0.12.5",
         "rich==13.9.4",
-        "schedule==1.2.2",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "habit-tracker=habit_tracker:app",